@@ -36,6 +36,7 @@ class LoggerManager:
         self._is_configured = False
         self._default_settings = None
         self._formatter = None
+        self._handlers_by_type = {}
 
     def configure(
             self,
@@ -70,9 +71,24 @@ class LoggerManager:
         if custom_handler_factory is not None:
             self._add_custom_handlers(root_logger, settings, custom_handler_factory)
 
+        for handler in root_logger.handlers:
+            self._handlers_by_type.setdefault(type(handler), []).append(handler)
+
         self._managed_loggers[self._domain] = root_logger
         self._is_configured = True
 
+    @property
+    def handlers_by_type(self) -> dict[type, list[logging.Handler]]:
+        """Root logger handlers indexed by their concrete class.
+
+        Populated once during configure(); allows O(1) lookup of a specific
+        handler kind instead of scanning the handler list.
+
+        Returns:
+            Mapping of handler class to handlers of that class
+        """
+        return self._handlers_by_type
+
     def get_logger(self, module_path: str = None) -> logging.Logger:
         """Get or create logger for specific module.
 
@@ -190,6 +206,7 @@ class LoggerManager:
             self._listener.stop()
             self._listener = None
 
+        self._handlers_by_type.clear()
         self._is_configured = False
 
     @staticmethod